@@ -74,33 +74,29 @@ async def request_advanced_configuration():
     tls_options = TlsOptions(
         grease_enabled=True,
         enable_ocsp_stapling=True,
-        curves_list=":".join(["X25519", "P-256", "P-384"]),
-        cipher_list=":".join(
-            [
-                "TLS_AES_128_GCM_SHA256",
-                "TLS_AES_256_GCM_SHA384",
-                "TLS_CHACHA20_POLY1305_SHA256",
-                "TLS_ECDHE_ECDSA_WITH_AES_128_GCM_SHA256",
-                "TLS_ECDHE_ECDSA_WITH_AES_256_GCM_SHA384",
-                "TLS_ECDHE_ECDSA_WITH_CHACHA20_POLY1305_SHA256",
-                "TLS_ECDHE_RSA_WITH_AES_128_GCM_SHA256",
-                "TLS_ECDHE_RSA_WITH_AES_256_GCM_SHA384",
-                "TLS_ECDHE_RSA_WITH_CHACHA20_POLY1305_SHA256",
-            ]
-        ),
-        sigalgs_list=":".join(
-            [
-                "ecdsa_secp256r1_sha256",
-                "rsa_pss_rsae_sha256",
-                "rsa_pkcs1_sha256",
-                "ecdsa_secp384r1_sha384",
-                "rsa_pss_rsae_sha384",
-                "rsa_pkcs1_sha384",
-                "rsa_pss_rsae_sha512",
-                "rsa_pkcs1_sha512",
-                "rsa_pkcs1_sha1",
-            ]
-        ),
+        curves_list=["X25519", "P-256", "P-384"],
+        cipher_list=[
+            "TLS_AES_128_GCM_SHA256",
+            "TLS_AES_256_GCM_SHA384",
+            "TLS_CHACHA20_POLY1305_SHA256",
+            "TLS_ECDHE_ECDSA_WITH_AES_128_GCM_SHA256",
+            "TLS_ECDHE_ECDSA_WITH_AES_256_GCM_SHA384",
+            "TLS_ECDHE_ECDSA_WITH_CHACHA20_POLY1305_SHA256",
+            "TLS_ECDHE_RSA_WITH_AES_128_GCM_SHA256",
+            "TLS_ECDHE_RSA_WITH_AES_256_GCM_SHA384",
+            "TLS_ECDHE_RSA_WITH_CHACHA20_POLY1305_SHA256",
+        ],
+        sigalgs_list=[
+            "ecdsa_secp256r1_sha256",
+            "rsa_pss_rsae_sha256",
+            "rsa_pkcs1_sha256",
+            "ecdsa_secp384r1_sha384",
+            "rsa_pss_rsae_sha384",
+            "rsa_pkcs1_sha384",
+            "rsa_pss_rsae_sha512",
+            "rsa_pkcs1_sha512",
+            "rsa_pkcs1_sha1",
+        ],
         alpn_protocols=[AlpnProtocol.HTTP2, AlpnProtocol.HTTP1],
         min_tls_version=TlsVersion.TLS_1_2,
         max_tls_version=TlsVersion.TLS_1_3,
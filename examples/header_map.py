@@ -1,11 +1,13 @@
 from wreq.header import HeaderMap
 
 if __name__ == "__main__":
-    headers = HeaderMap()
-    # Add Content-Type header
-    headers.insert("Content-Type", "application/json")
-    # Add Accept header (first value)
-    headers.insert("Accept", "application/json")
+    # Build the initial headers from a dict in a single call
+    headers = HeaderMap(
+        {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+    )
     # Add Accept header (second value)
     headers.insert("Accept", "text/html")
     # Get all values for 'Accept' header
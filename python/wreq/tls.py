@@ -145,6 +145,18 @@ class Identity:
         with the OpenSSL `pkcs12` tool:
 
             openssl pkcs12 -export -out identity.pfx -inkey key.pem -in cert.pem -certfile chain_certs.pem
+
+        Parsed identities are cached per archive and password, so loading the same archive again
+        skips the key derivation. The cache holds up to 32 entries and keeps each archive and its
+        decrypted key in memory until the entry is evicted or `clear_cache()` is called.
+        """
+        ...
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Drops every identity cached by `from_pkcs12_der`, releasing the archives and decrypted
+        keys it holds. Identities already handed out stay valid.
         """
         ...
 
@@ -166,6 +178,11 @@ class Identity:
 class CertStore:
     """
     Represents a certificate store for verifying TLS connections.
+
+    Stores built by from_der_certs, from_pem_certs and from_pem_stack are cached by their input,
+    so loading the same certificates again reuses the store. The cache holds up to 8 stores and
+    keeps each one and a copy of its certificates in memory until the entry is evicted or
+    `clear_cache()` is called.
     """
 
     def __init__(
@@ -189,18 +206,25 @@ class CertStore:
         """
         Creates a CertStore from a collection of DER-encoded certificates.
 
+        The result is cached; see CertStore.
+
         Args:
             certs: List of DER-encoded certificates (as bytes).
         """
         ...
 
     @staticmethod
-    def from_pem_certs(certs: Sequence[str]) -> "CertStore":
+    def from_pem_certs(certs: Sequence[str] | bytes) -> "CertStore":
         """
         Creates a CertStore from a collection of PEM-encoded certificates.
 
+        Each list entry must be a single PEM certificate. A bytes bundle is parsed as a
+        PEM stack, as with from_pem_stack.
+
+        The result is cached; see CertStore.
+
         Args:
-            certs: List of PEM-encoded certificates (as str).
+            certs: List of PEM-encoded certificates (as str), or a PEM bundle (as bytes).
         """
         ...
 
@@ -209,11 +233,23 @@ class CertStore:
         """
         Creates a CertStore from a PEM-encoded certificate stack.
 
+        This is the preferred way to load a CA bundle such as ca-certificates.crt.
+
+        The result is cached; see CertStore.
+
         Args:
             certs: PEM-encoded certificate stack (as bytes).
         """
         ...
 
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Drops every store cached by from_der_certs, from_pem_certs and from_pem_stack,
+        releasing the certificates they were built from. Stores already handed out stay valid.
+        """
+        ...
+
 
 @final
 class KeyLog:
@@ -363,21 +399,23 @@ class Params(TypedDict):
     for authentication with reduced long-term key exposure.
     """
 
-    curves_list: NotRequired[str]
+    curves_list: NotRequired[str | Sequence[str]]
     """
-    List of supported elliptic curves.
+    List of supported elliptic curves, as a non-empty colon-separated string or sequence of names.
     """
 
-    sigalgs_list: NotRequired[str]
+    sigalgs_list: NotRequired[str | Sequence[str]]
     """
-    List of supported signature algorithms.
+    List of supported signature algorithms, as a non-empty colon-separated string or sequence of names.
     """
 
-    cipher_list: NotRequired[str]
+    cipher_list: NotRequired[str | Sequence[str]]
     """
     Cipher suite configuration string.
 
     Uses BoringSSL's mini-language to select, enable, and prioritize ciphers.
+    A sequence of cipher names is joined with ':' on the Rust side. An empty string or
+    sequence raises ValueError.
     """
 
     preserve_tls13_cipher_list: NotRequired[bool]
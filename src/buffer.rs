@@ -15,32 +15,28 @@
 // specific language governing permissions and limitations
 // under the License.
 
-use std::os::raw::c_int;
+use std::convert::Infallible;
 
 use bytes::Bytes;
-use pyo3::{ffi, prelude::*};
+use pyo3::{prelude::*, types::PyBytes};
 use wreq::header::{HeaderName, HeaderValue, OrigHeaderName};
 
-/// [`PyBuffer`] enables zero-copy conversion of Rust [`Bytes`] to Python bytes.
-pub struct PyBuffer(BufferView);
-
-#[pyclass(frozen, skip_from_py_object)]
-struct BufferView(Bytes);
+/// [`PyBuffer`] converts Rust [`Bytes`] into Python `bytes`.
+///
+/// The data is copied straight into a new `bytes` object. CPython cannot expose foreign memory
+/// as `bytes` without a copy, so this is the cheapest way to hand out bytes.
+pub struct PyBuffer(Bytes);
 
 // ===== PyBuffer =====
 
 impl<'a> IntoPyObject<'a> for PyBuffer {
-    type Target = PyAny;
+    type Target = PyBytes;
     type Output = Bound<'a, Self::Target>;
-    type Error = PyErr;
+    type Error = Infallible;
 
     #[inline(always)]
     fn into_pyobject(self, py: Python<'a>) -> Result<Self::Output, Self::Error> {
-        let buffer = self.0.into_pyobject(py)?;
-        #[allow(unsafe_code)]
-        unsafe {
-            Bound::from_owned_ptr_or_err(py, ffi::PyBytes_FromObject(buffer.as_ptr()))
-        }
+        Ok(PyBytes::new(py, &self.0))
     }
 }
 
@@ -61,7 +57,7 @@ impl From<&Bytes> for PyBuffer {
 impl From<Bytes> for PyBuffer {
     #[inline]
     fn from(value: Bytes) -> Self {
-        PyBuffer(BufferView(value))
+        PyBuffer(value)
     }
 }
 
@@ -84,32 +80,3 @@ impl From<HeaderValue> for PyBuffer {
         Self::from(Bytes::from_owner(value))
     }
 }
-
-// ===== BufferView =====
-
-#[pymethods]
-impl BufferView {
-    #[allow(unsafe_code)]
-    unsafe fn __getbuffer__(
-        slf: PyRef<Self>,
-        view: *mut ffi::Py_buffer,
-        flags: c_int,
-    ) -> PyResult<()> {
-        let bytes = &slf.0;
-        let ret = unsafe {
-            // Fill the Py_buffer struct with information about the buffer
-            ffi::PyBuffer_FillInfo(
-                view,
-                slf.as_ptr() as *mut _,
-                bytes.as_ptr() as *mut _,
-                bytes.len() as _,
-                1,
-                flags,
-            )
-        };
-        if ret == -1 {
-            return Err(PyErr::fetch(slf.py()));
-        }
-        Ok(())
-    }
-}
@@ -8,14 +8,15 @@ mod query;
 
 use std::{
     net::{IpAddr, Ipv4Addr, Ipv6Addr},
-    sync::Arc,
+    sync::{Arc, OnceLock},
     time::Duration,
 };
 
-use pyo3::{IntoPyObjectExt, coroutine::CancelHandle, prelude::*, pybacked::PyBackedStr};
+use pyo3::{
+    IntoPyObjectExt, coroutine::CancelHandle, prelude::*, pybacked::PyBackedStr, types::PyDict,
+};
 use req::{Request, WebSocketRequest};
 use tokio_util::sync::CancellationToken;
-use wreq::tls::trust::CertStore;
 
 use self::{
     nogil::NoGIL,
@@ -34,7 +35,7 @@ use crate::{
     http2::Http2Options,
     proxy::Proxy,
     redirect,
-    tls::{Identity, KeyLog, TlsOptions, TlsVerify, TlsVersion},
+    tls::{CertStore, Identity, KeyLog, TlsOptions, TlsVerify, TlsVersion},
 };
 
 /// A IP socket address.
@@ -171,60 +172,61 @@ impl FromPyObject<'_, '_> for Builder {
     type Error = PyErr;
 
     fn extract(ob: Borrowed<PyAny>) -> PyResult<Self> {
+        let dict = ob.cast::<PyDict>()?;
         let mut builder = Self::default();
-        extract_option!(ob, builder, emulation);
-        extract_option!(ob, builder, user_agent);
-        extract_option!(ob, builder, headers);
-        extract_option!(ob, builder, orig_headers);
-        extract_option!(ob, builder, referer);
-        extract_option!(ob, builder, redirect);
-        extract_option!(ob, builder, raise_for_status);
-
-        extract_option!(ob, builder, cookie_store);
-        extract_option!(ob, builder, cookie_provider);
-
-        extract_option!(ob, builder, timeout);
-        extract_option!(ob, builder, connect_timeout);
-        extract_option!(ob, builder, read_timeout);
-
-        extract_option!(ob, builder, tcp_keepalive);
-        extract_option!(ob, builder, tcp_keepalive_interval);
-        extract_option!(ob, builder, tcp_keepalive_retries);
-        extract_option!(ob, builder, tcp_user_timeout);
-        extract_option!(ob, builder, tcp_nodelay);
-        extract_option!(ob, builder, tcp_reuse_address);
-
-        extract_option!(ob, builder, pool_idle_timeout);
-        extract_option!(ob, builder, pool_max_idle_per_host);
-        extract_option!(ob, builder, pool_max_size);
-
-        extract_option!(ob, builder, no_proxy);
-        extract_option!(ob, builder, proxies);
-        extract_option!(ob, builder, local_address);
-        extract_option!(ob, builder, local_addresses);
-        extract_option!(ob, builder, interface);
-
-        extract_option!(ob, builder, https_only);
-        extract_option!(ob, builder, http1_only);
-        extract_option!(ob, builder, http2_only);
-        extract_option!(ob, builder, http1_options);
-        extract_option!(ob, builder, http2_options);
-
-        extract_option!(ob, builder, tls_verify);
-        extract_option!(ob, builder, tls_verify_hostname);
-        extract_option!(ob, builder, tls_identity);
-        extract_option!(ob, builder, tls_keylog);
-        extract_option!(ob, builder, tls_info);
-        extract_option!(ob, builder, tls_min_version);
-        extract_option!(ob, builder, tls_max_version);
-        extract_option!(ob, builder, tls_options);
-
-        extract_option!(ob, builder, dns_options);
-
-        extract_option!(ob, builder, gzip);
-        extract_option!(ob, builder, brotli);
-        extract_option!(ob, builder, deflate);
-        extract_option!(ob, builder, zstd);
+        extract_option!(dict, builder, emulation);
+        extract_option!(dict, builder, user_agent);
+        extract_option!(dict, builder, headers);
+        extract_option!(dict, builder, orig_headers);
+        extract_option!(dict, builder, referer);
+        extract_option!(dict, builder, redirect);
+        extract_option!(dict, builder, raise_for_status);
+
+        extract_option!(dict, builder, cookie_store);
+        extract_option!(dict, builder, cookie_provider);
+
+        extract_option!(dict, builder, timeout);
+        extract_option!(dict, builder, connect_timeout);
+        extract_option!(dict, builder, read_timeout);
+
+        extract_option!(dict, builder, tcp_keepalive);
+        extract_option!(dict, builder, tcp_keepalive_interval);
+        extract_option!(dict, builder, tcp_keepalive_retries);
+        extract_option!(dict, builder, tcp_user_timeout);
+        extract_option!(dict, builder, tcp_nodelay);
+        extract_option!(dict, builder, tcp_reuse_address);
+
+        extract_option!(dict, builder, pool_idle_timeout);
+        extract_option!(dict, builder, pool_max_idle_per_host);
+        extract_option!(dict, builder, pool_max_size);
+
+        extract_option!(dict, builder, no_proxy);
+        extract_option!(dict, builder, proxies);
+        extract_option!(dict, builder, local_address);
+        extract_option!(dict, builder, local_addresses);
+        extract_option!(dict, builder, interface);
+
+        extract_option!(dict, builder, https_only);
+        extract_option!(dict, builder, http1_only);
+        extract_option!(dict, builder, http2_only);
+        extract_option!(dict, builder, http1_options);
+        extract_option!(dict, builder, http2_options);
+
+        extract_option!(dict, builder, tls_verify);
+        extract_option!(dict, builder, tls_verify_hostname);
+        extract_option!(dict, builder, tls_identity);
+        extract_option!(dict, builder, tls_keylog);
+        extract_option!(dict, builder, tls_info);
+        extract_option!(dict, builder, tls_min_version);
+        extract_option!(dict, builder, tls_max_version);
+        extract_option!(dict, builder, tls_options);
+
+        extract_option!(dict, builder, dns_options);
+
+        extract_option!(dict, builder, gzip);
+        extract_option!(dict, builder, brotli);
+        extract_option!(dict, builder, deflate);
+        extract_option!(dict, builder, zstd);
         Ok(builder)
     }
 }
@@ -406,7 +408,7 @@ impl Client {
                         TlsVerify::CertificatePath(path_buf) => {
                             let pem_data = std::fs::read(path_buf)?;
                             let store =
-                                CertStore::from_pem_stack(pem_data).map_err(Error::Library)?;
+                                CertStore::load_pem_stack(&pem_data).map_err(Error::Library)?;
                             builder.tls_cert_store(store)
                         }
                         TlsVerify::CertificateStore(cert_store) => {
@@ -623,6 +625,16 @@ impl Client {
     }
 }
 
+impl Client {
+    /// Returns the lazily-initialized client shared by the module-level request functions,
+    /// so that connections and TLS sessions are pooled across calls.
+    #[inline]
+    pub fn shared() -> Client {
+        static SHARED_CLIENT: OnceLock<Client> = OnceLock::new();
+        SHARED_CLIENT.get_or_init(Client::default).clone()
+    }
+}
+
 // ===== impl BlockingClient =====
 
 #[pymethods]
@@ -794,3 +806,11 @@ impl BlockingClient {
         self.close();
     }
 }
+
+impl BlockingClient {
+    /// Returns a blocking handle to the shared client used by the module-level request functions.
+    #[inline]
+    pub fn shared() -> BlockingClient {
+        BlockingClient(Client::shared())
+    }
+}
@@ -5,7 +5,7 @@ use std::{
 
 use futures_util::TryFutureExt;
 use http::header::COOKIE;
-use pyo3::{PyResult, prelude::*, pybacked::PyBackedStr};
+use pyo3::{PyResult, prelude::*, pybacked::PyBackedStr, types::PyDict};
 
 use crate::{
     client::{
@@ -215,36 +215,37 @@ impl FromPyObject<'_, '_> for Request {
     type Error = PyErr;
 
     fn extract(ob: Borrowed<PyAny>) -> PyResult<Request> {
+        let dict = ob.cast::<PyDict>()?;
         let mut request = Self::default();
-        extract_option!(ob, request, emulation);
-        extract_option!(ob, request, proxy);
-        extract_option!(ob, request, local_address);
-        extract_option!(ob, request, local_addresses);
-        extract_option!(ob, request, interface);
-
-        extract_option!(ob, request, timeout);
-        extract_option!(ob, request, read_timeout);
-
-        extract_option!(ob, request, version);
-        extract_option!(ob, request, headers);
-        extract_option!(ob, request, orig_headers);
-        extract_option!(ob, request, default_headers);
-        extract_option!(ob, request, cookies);
-        extract_option!(ob, request, redirect);
-        extract_option!(ob, request, cookie_provider);
-        extract_option!(ob, request, auth);
-        extract_option!(ob, request, bearer_auth);
-        extract_option!(ob, request, basic_auth);
-        extract_option!(ob, request, query);
-        extract_option!(ob, request, form);
-        extract_option!(ob, request, json);
-        extract_option!(ob, request, body);
-        extract_option!(ob, request, multipart);
-
-        extract_option!(ob, request, gzip);
-        extract_option!(ob, request, brotli);
-        extract_option!(ob, request, deflate);
-        extract_option!(ob, request, zstd);
+        extract_option!(dict, request, emulation);
+        extract_option!(dict, request, proxy);
+        extract_option!(dict, request, local_address);
+        extract_option!(dict, request, local_addresses);
+        extract_option!(dict, request, interface);
+
+        extract_option!(dict, request, timeout);
+        extract_option!(dict, request, read_timeout);
+
+        extract_option!(dict, request, version);
+        extract_option!(dict, request, headers);
+        extract_option!(dict, request, orig_headers);
+        extract_option!(dict, request, default_headers);
+        extract_option!(dict, request, cookies);
+        extract_option!(dict, request, redirect);
+        extract_option!(dict, request, cookie_provider);
+        extract_option!(dict, request, auth);
+        extract_option!(dict, request, bearer_auth);
+        extract_option!(dict, request, basic_auth);
+        extract_option!(dict, request, query);
+        extract_option!(dict, request, form);
+        extract_option!(dict, request, json);
+        extract_option!(dict, request, body);
+        extract_option!(dict, request, multipart);
+
+        extract_option!(dict, request, gzip);
+        extract_option!(dict, request, brotli);
+        extract_option!(dict, request, deflate);
+        extract_option!(dict, request, zstd);
 
         Ok(request)
     }
@@ -256,30 +257,31 @@ impl FromPyObject<'_, '_> for WebSocketRequest {
     type Error = PyErr;
 
     fn extract(ob: Borrowed<PyAny>) -> PyResult<Self> {
+        let dict = ob.cast::<PyDict>()?;
         let mut params = Self::default();
-        extract_option!(ob, params, emulation);
-        extract_option!(ob, params, proxy);
-        extract_option!(ob, params, local_address);
-        extract_option!(ob, params, local_addresses);
-        extract_option!(ob, params, interface);
-
-        extract_option!(ob, params, version);
-        extract_option!(ob, params, headers);
-        extract_option!(ob, params, orig_headers);
-        extract_option!(ob, params, default_headers);
-        extract_option!(ob, params, cookies);
-        extract_option!(ob, params, protocols);
-        extract_option!(ob, params, auth);
-        extract_option!(ob, params, bearer_auth);
-        extract_option!(ob, params, basic_auth);
-        extract_option!(ob, params, query);
-
-        extract_option!(ob, params, read_buffer_size);
-        extract_option!(ob, params, write_buffer_size);
-        extract_option!(ob, params, max_write_buffer_size);
-        extract_option!(ob, params, max_message_size);
-        extract_option!(ob, params, max_frame_size);
-        extract_option!(ob, params, accept_unmasked_frames);
+        extract_option!(dict, params, emulation);
+        extract_option!(dict, params, proxy);
+        extract_option!(dict, params, local_address);
+        extract_option!(dict, params, local_addresses);
+        extract_option!(dict, params, interface);
+
+        extract_option!(dict, params, version);
+        extract_option!(dict, params, headers);
+        extract_option!(dict, params, orig_headers);
+        extract_option!(dict, params, default_headers);
+        extract_option!(dict, params, cookies);
+        extract_option!(dict, params, protocols);
+        extract_option!(dict, params, auth);
+        extract_option!(dict, params, bearer_auth);
+        extract_option!(dict, params, basic_auth);
+        extract_option!(dict, params, query);
+
+        extract_option!(dict, params, read_buffer_size);
+        extract_option!(dict, params, write_buffer_size);
+        extract_option!(dict, params, max_write_buffer_size);
+        extract_option!(dict, params, max_message_size);
+        extract_option!(dict, params, max_frame_size);
+        extract_option!(dict, params, accept_unmasked_frames);
         Ok(params)
     }
 }
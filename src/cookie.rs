@@ -26,7 +26,7 @@ pub enum PyCookie {
 
 /// A single HTTP cookie.
 #[derive(Clone)]
-#[pyclass(subclass, str, frozen, from_py_object)]
+#[pyclass(subclass, str, frozen, from_py_object, freelist = 64)]
 pub struct Cookie(RawCookie<'static>);
 
 /// A helper struct to allow parsing either a single cookie string or multiple cookies from a dict.
@@ -1,3 +1,8 @@
+use std::{
+    collections::HashMap,
+    sync::{LazyLock, Mutex, PoisonError},
+};
+
 use pyo3::prelude::*;
 
 define_enum!(
@@ -162,7 +167,7 @@ define_enum!(
 /// emulation, including the profile, platform, and whether to enable certain features
 /// like HTTP/2 or headers.
 #[derive(Clone)]
-#[pyclass(subclass, from_py_object)]
+#[pyclass(subclass, frozen, from_py_object)]
 pub struct Emulation(pub wreq_util::Emulation);
 
 #[pymethods]
@@ -192,6 +197,13 @@ impl Emulation {
     }
 }
 
+/// Emulations built from bare profiles, keyed by profile and populated on first use.
+///
+/// Building the TLS, HTTP/2 and header presets for a profile is comparatively expensive, so it
+/// is done once per profile and cloned afterwards.
+static PROFILE_EMULATIONS: LazyLock<Mutex<HashMap<Profile, wreq::Emulation>>> =
+    LazyLock::new(Default::default);
+
 /// A helper enum to allow accepting either a Profile or an Emulation in the same parameter.
 #[derive(FromPyObject)]
 pub enum EmulationLike {
@@ -202,7 +214,12 @@ pub enum EmulationLike {
 impl wreq::IntoEmulation for EmulationLike {
     fn into_emulation(self) -> wreq::Emulation {
         match self {
-            EmulationLike::Profile(profile) => profile.into_ffi().into_emulation(),
+            EmulationLike::Profile(profile) => PROFILE_EMULATIONS
+                .lock()
+                .unwrap_or_else(PoisonError::into_inner)
+                .entry(profile)
+                .or_insert_with(|| profile.into_ffi().into_emulation())
+                .clone(),
             EmulationLike::Emulation(inner) => inner.0.into_emulation(),
         }
     }
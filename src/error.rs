@@ -1,6 +1,8 @@
 use pyo3::{
     PyErr, create_exception,
-    exceptions::{PyException, PyRuntimeError, PyStopAsyncIteration, PyStopIteration},
+    exceptions::{
+        PyException, PyRuntimeError, PyStopAsyncIteration, PyStopIteration, PyValueError,
+    },
 };
 use wreq::header;
 
@@ -72,6 +74,7 @@ pub enum Error {
     Decode(cookie::ParseError),
     Json(serde_json::Error),
     Form(serde_urlencoded::ser::Error),
+    EmptyList(&'static str),
     Library(wreq::Error),
 }
 
@@ -98,6 +101,7 @@ impl From<Error> for PyErr {
             Error::Builder(err) => BuilderError::new_err(format!("Builder error: {err:?}")),
             Error::Json(err) => PyRuntimeError::new_err(format!("JSON error: {err:?}")),
             Error::Form(err) => PyRuntimeError::new_err(format!("Form error: {err:?}")),
+            Error::EmptyList(name) => PyValueError::new_err(format!("{name} must not be empty")),
             Error::Library(err) => wrap_error!(err,
                 is_body => BodyError,
                 is_tls => TlsError,
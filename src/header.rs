@@ -18,6 +18,40 @@ pub struct HeaderMap(pub header::HeaderMap);
 #[pyclass(subclass, str, skip_from_py_object)]
 pub struct OrigHeaderMap(pub header::OrigHeaderMap);
 
+define_iter!(
+    /// An iterator over header names.
+    ///
+    /// The names are collected from the map up front, which is cheap because standard names are
+    /// static and custom names are reference-counted. Each one is converted into a Python `bytes`
+    /// object only when it is yielded.
+    HeaderNameIter,
+    HeaderName,
+    PyBuffer,
+    PyBuffer::from
+);
+
+define_iter!(
+    /// An iterator over header values.
+    ///
+    /// The values are reference-counted clones collected from the map up front. Each one is
+    /// converted into a Python `bytes` object only when it is yielded.
+    HeaderValueIter,
+    HeaderValue,
+    PyBuffer,
+    PyBuffer::from
+);
+
+define_iter!(
+    /// An iterator over `(name, value)` header pairs.
+    ///
+    /// Like [`HeaderValueIter`], the pairs are collected up front and converted into Python
+    /// `bytes` only as they are yielded.
+    HeaderItemIter,
+    (HeaderName, HeaderValue),
+    (PyBuffer, PyBuffer),
+    |(name, value)| (PyBuffer::from(name), PyBuffer::from(value))
+);
+
 // ===== impl HeaderMap =====
 
 #[pymethods]
@@ -27,6 +61,7 @@ impl HeaderMap {
     #[pyo3(signature = (dict=None, capacity=None))]
     fn new(dict: Option<&Bound<'_, PyDict>>, capacity: Option<usize>) -> HeaderMap {
         let mut headers = capacity
+            .or_else(|| dict.map(|dict| dict.len()))
             .map(header::HeaderMap::with_capacity)
             .unwrap_or_default();
 
@@ -84,16 +119,12 @@ impl HeaderMap {
         .map(PyBuffer::from)
     }
 
-    /// Returns a view of all values associated with a key.
+    /// Returns an iterator over all values associated with a key.
     #[pyo3(signature = (key))]
-    fn get_all<'py>(&self, py: Python<'py>, key: PyBackedStr) -> Vec<PyBuffer> {
+    fn get_all(&self, py: Python, key: PyBackedStr) -> HeaderValueIter {
         py.detach(|| {
-            self.0
-                .get_all::<&str>(key.as_ref())
-                .iter()
-                .cloned()
-                .map(PyBuffer::from)
-                .collect()
+            let values = self.0.get_all::<&str>(key.as_ref());
+            HeaderValueIter(values.iter().cloned().collect::<Vec<_>>().into_iter())
         })
     }
 
@@ -139,26 +170,14 @@ impl HeaderMap {
 
     /// An iterator visiting all keys.
     #[inline]
-    fn keys<'py>(&self, py: Python<'py>) -> Vec<PyBuffer> {
-        py.detach(|| {
-            self.0
-                .keys()
-                .cloned()
-                .map(PyBuffer::from)
-                .collect::<Vec<_>>()
-        })
+    fn keys(&self, py: Python) -> HeaderNameIter {
+        py.detach(|| HeaderNameIter(self.0.keys().cloned().collect::<Vec<_>>().into_iter()))
     }
 
     ///  An iterator visiting all values.
     #[inline]
-    fn values<'py>(&self, py: Python<'py>) -> Vec<PyBuffer> {
-        py.detach(|| {
-            self.0
-                .values()
-                .cloned()
-                .map(PyBuffer::from)
-                .collect::<Vec<_>>()
-        })
+    fn values(&self, py: Python) -> HeaderValueIter {
+        py.detach(|| HeaderValueIter(self.0.values().cloned().collect::<Vec<_>>().into_iter()))
     }
 
     /// Returns the number of headers stored in the map.
@@ -220,15 +239,11 @@ impl HeaderMap {
         self.0.len()
     }
 
-    fn __iter__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyIterator>> {
-        let items: Vec<_> = py.detach(|| {
-            self.0
-                .iter()
-                .map(|(k, v)| (PyBuffer::from(k.clone()), PyBuffer::from(v.clone())))
-                .collect()
-        });
-        let pylist = PyList::new(py, items)?;
-        PyIterator::from_object(&pylist)
+    fn __iter__(&self, py: Python) -> HeaderItemIter {
+        py.detach(|| {
+            let items = self.0.iter().map(|(k, v)| (k.clone(), v.clone()));
+            HeaderItemIter(items.collect::<Vec<_>>().into_iter())
+        })
     }
 }
 
@@ -1,4 +1,4 @@
-use pyo3::prelude::*;
+use pyo3::{prelude::*, types::PyDict};
 
 /// A builder for [`Http1Options`].
 #[derive(Default)]
@@ -42,15 +42,16 @@ impl FromPyObject<'_, '_> for Builder {
     type Error = PyErr;
 
     fn extract(ob: Borrowed<PyAny>) -> PyResult<Self> {
+        let dict = ob.cast::<PyDict>()?;
         let mut params = Self::default();
-        extract_option!(ob, params, http09_responses);
-        extract_option!(ob, params, writev);
-        extract_option!(ob, params, max_headers);
-        extract_option!(ob, params, read_buf_exact_size);
-        extract_option!(ob, params, max_buf_size);
-        extract_option!(ob, params, allow_spaces_after_header_name_in_responses);
-        extract_option!(ob, params, ignore_invalid_headers_in_responses);
-        extract_option!(ob, params, allow_obsolete_multiline_headers_in_responses);
+        extract_option!(dict, params, http09_responses);
+        extract_option!(dict, params, writev);
+        extract_option!(dict, params, max_headers);
+        extract_option!(dict, params, read_buf_exact_size);
+        extract_option!(dict, params, max_buf_size);
+        extract_option!(dict, params, allow_spaces_after_header_name_in_responses);
+        extract_option!(dict, params, ignore_invalid_headers_in_responses);
+        extract_option!(dict, params, allow_obsolete_multiline_headers_in_responses);
         Ok(params)
     }
 }
@@ -1,6 +1,6 @@
 use std::{fmt::Debug, time::Duration};
 
-use pyo3::prelude::*;
+use pyo3::{prelude::*, types::PyDict};
 
 define_enum!(
     /// Represents the order of HTTP/2 pseudo-header fields in the header block.
@@ -300,29 +300,30 @@ impl FromPyObject<'_, '_> for Builder {
     type Error = PyErr;
 
     fn extract(ob: Borrowed<PyAny>) -> PyResult<Self> {
+        let dict = ob.cast::<PyDict>()?;
         let mut params = Self::default();
-        extract_option!(ob, params, initial_window_size);
-        extract_option!(ob, params, initial_connection_window_size);
-        extract_option!(ob, params, initial_max_send_streams);
-        extract_option!(ob, params, initial_stream_id);
-        extract_option!(ob, params, adaptive_window);
-        extract_option!(ob, params, max_frame_size);
-        extract_option!(ob, params, max_header_list_size);
-        extract_option!(ob, params, header_table_size);
-        extract_option!(ob, params, max_concurrent_streams);
-        extract_option!(ob, params, keep_alive_interval);
-        extract_option!(ob, params, keep_alive_timeout);
-        extract_option!(ob, params, keep_alive_while_idle);
-        extract_option!(ob, params, enable_push);
-        extract_option!(ob, params, enable_connect_protocol);
-        extract_option!(ob, params, no_rfc7540_priorities);
-        extract_option!(ob, params, max_concurrent_reset_streams);
-        extract_option!(ob, params, max_send_buf_size);
-        extract_option!(ob, params, max_pending_accept_reset_streams);
-        extract_option!(ob, params, headers_stream_dependency);
-        extract_option!(ob, params, headers_pseudo_order);
-        extract_option!(ob, params, settings_order);
-        extract_option!(ob, params, priorities);
+        extract_option!(dict, params, initial_window_size);
+        extract_option!(dict, params, initial_connection_window_size);
+        extract_option!(dict, params, initial_max_send_streams);
+        extract_option!(dict, params, initial_stream_id);
+        extract_option!(dict, params, adaptive_window);
+        extract_option!(dict, params, max_frame_size);
+        extract_option!(dict, params, max_header_list_size);
+        extract_option!(dict, params, header_table_size);
+        extract_option!(dict, params, max_concurrent_streams);
+        extract_option!(dict, params, keep_alive_interval);
+        extract_option!(dict, params, keep_alive_timeout);
+        extract_option!(dict, params, keep_alive_while_idle);
+        extract_option!(dict, params, enable_push);
+        extract_option!(dict, params, enable_connect_protocol);
+        extract_option!(dict, params, no_rfc7540_priorities);
+        extract_option!(dict, params, max_concurrent_reset_streams);
+        extract_option!(dict, params, max_send_buf_size);
+        extract_option!(dict, params, max_pending_accept_reset_streams);
+        extract_option!(dict, params, headers_stream_dependency);
+        extract_option!(dict, params, headers_pseudo_order);
+        extract_option!(dict, params, settings_order);
+        extract_option!(dict, params, priorities);
         Ok(params)
     }
 }
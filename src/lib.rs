@@ -183,7 +183,7 @@ mod r#async {
         url: PyBackedStr,
         kwds: Option<Request>,
     ) -> PyResult<Response> {
-        Client::default().request(cancel, method, url, kwds).await
+        Client::shared().request(cancel, method, url, kwds).await
     }
 
     /// Make a WebSocket connection with the given parameters.
@@ -195,7 +195,7 @@ mod r#async {
         url: PyBackedStr,
         kwds: Option<WebSocketRequest>,
     ) -> PyResult<WebSocket> {
-        Client::default().websocket(cancel, url, kwds).await
+        Client::shared().websocket(cancel, url, kwds).await
     }
 }
 
@@ -301,7 +301,7 @@ mod blocking {
         url: PyBackedStr,
         kwds: Option<Request>,
     ) -> PyResult<BlockingResponse> {
-        BlockingClient::default().request(py, method, url, kwds)
+        BlockingClient::shared().request(py, method, url, kwds)
     }
 
     /// Make a WebSocket connection with the given parameters (blocking).
@@ -313,7 +313,7 @@ mod blocking {
         url: PyBackedStr,
         kwds: Option<WebSocketRequest>,
     ) -> PyResult<BlockingWebSocket> {
-        BlockingClient::default().websocket(py, url, kwds)
+        BlockingClient::shared().websocket(py, url, kwds)
     }
 }
 
@@ -326,7 +326,7 @@ pub async fn websocket(
     url: PyBackedStr,
     kwds: Option<WebSocketRequest>,
 ) -> PyResult<WebSocket> {
-    Client::default().websocket(cancel, url, kwds).await
+    Client::shared().websocket(cancel, url, kwds).await
 }
 
 #[pymodule(gil_used = false)]
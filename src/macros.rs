@@ -1,6 +1,8 @@
+// Options are looked up through the kwargs dict, cast once by the caller, so missing keys do not
+// raise (and discard) a KeyError.
 macro_rules! extract_option {
-    ($ob:expr, $params:expr, $field:ident) => {
-        if let Ok(value) = $ob.get_item(pyo3::intern!($ob.py(), stringify!($field))) {
+    ($dict:expr, $params:expr, $field:ident) => {
+        if let Some(value) = $dict.get_item(pyo3::intern!($dict.py(), stringify!($field)))? {
             $params.$field = value.extract()?;
         }
     };
@@ -133,7 +135,7 @@ macro_rules! define_enum {
 
     ($(#[$meta:meta])* const, $enum_type:ident, $ffi_type:ty, $(($rust_variant:ident, $ffi_variant:ident)),* $(,)?) => {
         $(#[$meta])*
-        #[pyclass(eq, eq_int, from_py_object)]
+        #[pyclass(eq, eq_int, frozen, from_py_object)]
         #[derive(Clone, Copy, PartialEq, Eq, Hash, Debug)]
         #[allow(non_camel_case_types)]
         #[allow(clippy::upper_case_acronyms)]
@@ -179,3 +181,29 @@ macro_rules! impl_print_str {
         }
     };
 }
+
+macro_rules! define_iter {
+    ($(#[$meta:meta])* $iter_type:ident, $item:ty, $output:ty, $convert:expr) => {
+        $(#[$meta])*
+        #[pyclass]
+        pub struct $iter_type(std::vec::IntoIter<$item>);
+
+        #[pymethods]
+        impl $iter_type {
+            #[inline]
+            fn __iter__(slf: PyRef<Self>) -> PyRef<Self> {
+                slf
+            }
+
+            #[inline]
+            fn __next__(&mut self) -> Option<$output> {
+                self.0.next().map($convert)
+            }
+
+            #[inline]
+            fn __length_hint__(&self) -> usize {
+                self.0.len()
+            }
+        }
+    };
+}
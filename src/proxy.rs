@@ -1,5 +1,5 @@
 use bytes::Bytes;
-use pyo3::{prelude::*, pybacked::PyBackedStr};
+use pyo3::{prelude::*, pybacked::PyBackedStr, types::PyDict};
 use wreq::header::HeaderValue;
 
 use crate::{error::Error, header::HeaderMap};
@@ -35,12 +35,13 @@ impl FromPyObject<'_, '_> for Builder {
     type Error = PyErr;
 
     fn extract(ob: Borrowed<PyAny>) -> PyResult<Self> {
+        let dict = ob.cast::<PyDict>()?;
         let mut builder = Self::default();
-        extract_option!(ob, builder, username);
-        extract_option!(ob, builder, password);
-        extract_option!(ob, builder, custom_http_auth);
-        extract_option!(ob, builder, custom_http_headers);
-        extract_option!(ob, builder, exclusion);
+        extract_option!(dict, builder, username);
+        extract_option!(dict, builder, password);
+        extract_option!(dict, builder, custom_http_auth);
+        extract_option!(dict, builder, custom_http_headers);
+        extract_option!(dict, builder, exclusion);
         Ok(builder)
     }
 }
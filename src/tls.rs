@@ -1,13 +1,14 @@
+mod cache;
 mod identity;
 mod keylog;
 mod store;
 
-use pyo3::prelude::*;
+use pyo3::{prelude::*, pybacked::PyBackedStr, types::PyDict};
 use wreq::tls::compress::CertificateCompressor;
 use wreq_util::emulate::compress;
 
 pub use self::{identity::Identity, keylog::KeyLog, store::CertStore};
-use crate::buffer::PyBuffer;
+use crate::{buffer::PyBuffer, error::Error};
 
 define_enum!(
     /// The TLS version.
@@ -20,6 +21,10 @@ define_enum!(
     TLS_1_3,
 );
 
+/// A colon-separated BoringSSL list (ciphers, curves or signature algorithms), given either as
+/// a `str` or as a sequence of `str`. Empty lists are rejected by [`ColonList::check`].
+pub struct ColonList(pub String);
+
 #[derive(FromPyObject)]
 pub enum TlsVerify {
     Verification(bool),
@@ -188,15 +193,15 @@ struct Builder {
     delegated_credentials: Option<String>,
 
     /// List of supported elliptic curves.
-    curves_list: Option<String>,
+    curves_list: Option<ColonList>,
 
     /// List of supported signature algorithms.
-    sigalgs_list: Option<String>,
+    sigalgs_list: Option<ColonList>,
 
     /// Cipher suite configuration string.
     ///
     /// Uses BoringSSL's mini-language to select, enable, and prioritize ciphers.
-    cipher_list: Option<String>,
+    cipher_list: Option<ColonList>,
 
     /// Sets whether to preserve the TLS 1.3 cipher list as configured by [`Self::cipher_list`].
     preserve_tls13_cipher_list: Option<bool>,
@@ -218,33 +223,37 @@ impl FromPyObject<'_, '_> for Builder {
     type Error = PyErr;
 
     fn extract(ob: Borrowed<PyAny>) -> PyResult<Self> {
+        let dict = ob.cast::<PyDict>()?;
         let mut params = Self::default();
-        extract_option!(ob, params, alpn_protocols);
-        extract_option!(ob, params, alps_protocols);
-        extract_option!(ob, params, alps_use_new_codepoint);
-        extract_option!(ob, params, session_ticket);
-        extract_option!(ob, params, min_tls_version);
-        extract_option!(ob, params, max_tls_version);
-        extract_option!(ob, params, pre_shared_key);
-        extract_option!(ob, params, enable_ech_grease);
-        extract_option!(ob, params, permute_extensions);
-        extract_option!(ob, params, grease_enabled);
-        extract_option!(ob, params, enable_ocsp_stapling);
-        extract_option!(ob, params, enable_signed_cert_timestamps);
-        extract_option!(ob, params, record_size_limit);
-        extract_option!(ob, params, psk_skip_session_ticket);
-        extract_option!(ob, params, key_shares);
-        extract_option!(ob, params, psk_dhe_ke);
-        extract_option!(ob, params, renegotiation);
-        extract_option!(ob, params, delegated_credentials);
-        extract_option!(ob, params, curves_list);
-        extract_option!(ob, params, cipher_list);
-        extract_option!(ob, params, sigalgs_list);
-        extract_option!(ob, params, certificate_compression_algorithms);
-        extract_option!(ob, params, extension_permutation);
-        extract_option!(ob, params, aes_hw_override);
-        extract_option!(ob, params, preserve_tls13_cipher_list);
-        extract_option!(ob, params, random_aes_hw_override);
+        extract_option!(dict, params, alpn_protocols);
+        extract_option!(dict, params, alps_protocols);
+        extract_option!(dict, params, alps_use_new_codepoint);
+        extract_option!(dict, params, session_ticket);
+        extract_option!(dict, params, min_tls_version);
+        extract_option!(dict, params, max_tls_version);
+        extract_option!(dict, params, pre_shared_key);
+        extract_option!(dict, params, enable_ech_grease);
+        extract_option!(dict, params, permute_extensions);
+        extract_option!(dict, params, grease_enabled);
+        extract_option!(dict, params, enable_ocsp_stapling);
+        extract_option!(dict, params, enable_signed_cert_timestamps);
+        extract_option!(dict, params, record_size_limit);
+        extract_option!(dict, params, psk_skip_session_ticket);
+        extract_option!(dict, params, key_shares);
+        extract_option!(dict, params, psk_dhe_ke);
+        extract_option!(dict, params, renegotiation);
+        extract_option!(dict, params, delegated_credentials);
+        extract_option!(dict, params, curves_list);
+        extract_option!(dict, params, cipher_list);
+        extract_option!(dict, params, sigalgs_list);
+        extract_option!(dict, params, certificate_compression_algorithms);
+        extract_option!(dict, params, extension_permutation);
+        extract_option!(dict, params, aes_hw_override);
+        extract_option!(dict, params, preserve_tls13_cipher_list);
+        extract_option!(dict, params, random_aes_hw_override);
+        ColonList::check(&params.curves_list, "curves_list")?;
+        ColonList::check(&params.cipher_list, "cipher_list")?;
+        ColonList::check(&params.sigalgs_list, "sigalgs_list")?;
         Ok(params)
     }
 }
@@ -360,9 +369,14 @@ impl TlsOptions {
                     params.delegated_credentials,
                     delegated_credentials
                 );
-                apply_option!(set_if_some, builder, params.curves_list, curves_list);
-                apply_option!(set_if_some, builder, params.cipher_list, cipher_list);
-                apply_option!(set_if_some, builder, params.sigalgs_list, sigalgs_list);
+                apply_option!(set_if_some_inner, builder, params.curves_list, curves_list);
+                apply_option!(set_if_some_inner, builder, params.cipher_list, cipher_list);
+                apply_option!(
+                    set_if_some_inner,
+                    builder,
+                    params.sigalgs_list,
+                    sigalgs_list
+                );
                 apply_option!(
                     set_if_some_map,
                     builder,
@@ -420,6 +434,38 @@ impl TlsOptions {
     }
 }
 
+// ===== impl ColonList =====
+
+impl FromPyObject<'_, '_> for ColonList {
+    type Error = PyErr;
+
+    fn extract(ob: Borrowed<PyAny>) -> PyResult<Self> {
+        if let Ok(list) = ob.extract::<String>() {
+            return Ok(Self(list));
+        }
+
+        let items = ob.extract::<Vec<PyBackedStr>>()?;
+        let mut list = String::with_capacity(items.iter().map(|item| item.len() + 1).sum());
+        for item in items {
+            if !list.is_empty() {
+                list.push(':');
+            }
+            list.push_str(&item);
+        }
+        Ok(Self(list))
+    }
+}
+
+impl ColonList {
+    /// Rejects an empty list, whether given as `""` or as an empty sequence.
+    fn check(list: &Option<Self>, name: &'static str) -> Result<(), Error> {
+        match list {
+            Some(Self(list)) if list.is_empty() => Err(Error::EmptyList(name)),
+            _ => Ok(()),
+        }
+    }
+}
+
 /// Information about the TLS connection.
 #[pyclass(frozen)]
 pub struct TlsInfo(pub wreq::tls::TlsInfo);
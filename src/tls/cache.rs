@@ -0,0 +1,131 @@
+use std::{
+    hash::{Hash, Hasher},
+    sync::{Mutex, MutexGuard, PoisonError},
+};
+
+use indexmap::{Equivalent, IndexMap};
+
+/// A bounded, least-recently-used cache of values built from byte buffers.
+///
+/// Entries are keyed by a small tag plus the exact buffers they were built from, compared part
+/// by part. Lookups borrow the buffers, so a hit never copies them; only a miss stores an owned
+/// copy of the key.
+pub struct BytesCache<T, V> {
+    entries: Mutex<IndexMap<Key<T>, V>>,
+    capacity: usize,
+}
+
+/// An owned [`BytesCache`] key.
+struct Key<T> {
+    tag: T,
+    parts: Box<[Box<[u8]>]>,
+}
+
+/// A borrowed form of a [`BytesCache`] key.
+struct KeyRef<'a, T, B> {
+    tag: T,
+    parts: &'a [B],
+}
+
+// ===== impl BytesCache =====
+
+impl<T, V> BytesCache<T, V>
+where
+    T: Copy + Hash + Eq,
+    V: Clone,
+{
+    /// Creates an empty cache holding at most `capacity` entries.
+    pub fn new(capacity: usize) -> Self {
+        Self {
+            entries: Mutex::new(IndexMap::with_capacity(capacity)),
+            capacity,
+        }
+    }
+
+    /// Returns the value cached for `(tag, parts)` and marks it as most recently used.
+    pub fn get<B: AsRef<[u8]>>(&self, tag: T, parts: &[B]) -> Option<V> {
+        let mut entries = self.lock();
+        let index = entries.get_index_of(&KeyRef { tag, parts })?;
+        let last = entries.len() - 1;
+        entries.move_index(index, last);
+        Some(entries[last].clone())
+    }
+
+    /// Caches `value` for `(tag, parts)`, evicting the least recently used entry when full.
+    ///
+    /// If another caller cached a value for the same key in the meantime, that value is kept
+    /// and returned instead, and nothing is evicted or copied.
+    pub fn insert<B: AsRef<[u8]>>(&self, tag: T, parts: &[B], value: V) -> V {
+        let mut entries = self.lock();
+        if let Some(existing) = entries.get(&KeyRef { tag, parts }) {
+            return existing.clone();
+        }
+
+        if entries.len() >= self.capacity {
+            entries.shift_remove_index(0);
+        }
+        let parts = parts.iter().map(|part| Box::from(part.as_ref())).collect();
+        entries.insert(Key { tag, parts }, value.clone());
+        value
+    }
+
+    /// Removes every entry.
+    pub fn clear(&self) {
+        self.lock().clear();
+    }
+
+    #[inline]
+    fn lock(&self) -> MutexGuard<'_, IndexMap<Key<T>, V>> {
+        self.entries.lock().unwrap_or_else(PoisonError::into_inner)
+    }
+}
+
+// ===== impl Key =====
+
+impl<T: Hash> Hash for Key<T> {
+    fn hash<H: Hasher>(&self, state: &mut H) {
+        hash_key(&self.tag, &*self.parts, state);
+    }
+}
+
+impl<T: Eq> PartialEq for Key<T> {
+    fn eq(&self, other: &Self) -> bool {
+        self.tag == other.tag && self.parts == other.parts
+    }
+}
+
+impl<T: Eq> Eq for Key<T> {}
+
+// ===== impl KeyRef =====
+
+impl<T: Hash, B: AsRef<[u8]>> Hash for KeyRef<'_, T, B> {
+    fn hash<H: Hasher>(&self, state: &mut H) {
+        hash_key(&self.tag, self.parts, state);
+    }
+}
+
+impl<T: Eq, B: AsRef<[u8]>> Equivalent<Key<T>> for KeyRef<'_, T, B> {
+    fn equivalent(&self, key: &Key<T>) -> bool {
+        self.tag == key.tag
+            && self.parts.len() == key.parts.len()
+            && self
+                .parts
+                .iter()
+                .zip(key.parts.iter())
+                .all(|(part, owned)| part.as_ref() == &**owned)
+    }
+}
+
+/// Hashes a key the same way for its owned and borrowed forms.
+fn hash_key<T, B, H>(tag: &T, parts: &[B], state: &mut H)
+where
+    T: Hash,
+    B: AsRef<[u8]>,
+    H: Hasher,
+{
+    tag.hash(state);
+    state.write_usize(parts.len());
+    for part in parts {
+        part.as_ref().hash(state);
+    }
+}
@@ -1,11 +1,30 @@
+use std::{
+    hash::{BuildHasher, RandomState},
+    sync::LazyLock,
+};
+
 use pyo3::{
     PyResult,
     pybacked::{PyBackedBytes, PyBackedStr},
     pyclass, pymethods,
 };
 
+use super::cache::BytesCache;
 use crate::error::Error;
 
+/// Maximum number of parsed PKCS #12 archives kept by [`Identity::from_pkcs12_der`].
+const PKCS12_CACHE_CAPACITY: usize = 32;
+
+/// Keyed hasher for archive passwords, so the cache never holds a password in the clear.
+static PKCS12_PASSWORD_HASHER: LazyLock<RandomState> = LazyLock::new(RandomState::new);
+
+/// Parsed PKCS #12 archives, keyed by the password digest and the archive bytes.
+///
+/// Decrypting an archive runs the password KDF, so clients built repeatedly from the
+/// same archive reuse the first result. The least recently used entry is evicted first.
+static PKCS12_IDENTITIES: LazyLock<BytesCache<u64, Identity>> =
+    LazyLock::new(|| BytesCache::new(PKCS12_CACHE_CAPACITY));
+
 /// Represents a private key and X509 cert as a client certificate.
 #[derive(Clone)]
 #[pyclass(from_py_object)]
@@ -25,15 +44,32 @@ impl Identity {
     /// ```bash
     /// openssl pkcs12 -export -out identity.pfx -inkey key.pem -in cert.pem -certfile chain_certs.pem
     /// ```
+    ///
+    /// Parsed identities are cached per archive and password, so loading the same archive again
+    /// skips the key derivation. The cache holds up to 32 entries and keeps each archive and its
+    /// decrypted key in memory until the entry is evicted or [`Identity::clear_cache`] is called.
     #[staticmethod]
     #[pyo3(signature = (buf, pass))]
     pub fn from_pkcs12_der(buf: PyBackedBytes, pass: PyBackedStr) -> PyResult<Identity> {
+        let digest = PKCS12_PASSWORD_HASHER.hash_one(&*pass);
+        if let Some(identity) = PKCS12_IDENTITIES.get(digest, &[&*buf]) {
+            return Ok(identity);
+        }
+
         wreq::tls::trust::Identity::from_pkcs12_der(buf.as_ref(), pass.as_ref())
             .map(Identity)
+            .map(|identity| PKCS12_IDENTITIES.insert(digest, &[&*buf], identity))
             .map_err(Error::Library)
             .map_err(Into::into)
     }
 
+    /// Drops every identity cached by [`Identity::from_pkcs12_der`], releasing the archives and
+    /// decrypted keys it holds. Identities already handed out stay valid.
+    #[staticmethod]
+    pub fn clear_cache() {
+        PKCS12_IDENTITIES.clear();
+    }
+
     /// Parses a chain of PEM encoded X509 certificates, with the leaf certificate first.
     /// `key` is a PEM encoded PKCS #8 formatted private key for the leaf certificate.
     ///
@@ -1,11 +1,39 @@
+use std::sync::LazyLock;
+
 use pyo3::{
-    PyResult,
+    FromPyObject, PyResult,
     pybacked::{PyBackedBytes, PyBackedStr},
     pyclass, pymethods,
 };
 
+use super::cache::BytesCache;
 use crate::error::Error;
 
+/// Maximum number of certificate stores kept by the `from_*` constructors.
+const CERT_STORE_CACHE_CAPACITY: usize = 8;
+
+/// Certificate stores keyed by the encoding and bytes they were built from.
+///
+/// Stores are read-only once built, so clients loading the same bundle share one store
+/// instead of re-parsing it. The least recently used entry is evicted first.
+static CERT_STORES: LazyLock<BytesCache<Encoding, wreq::tls::trust::CertStore>> =
+    LazyLock::new(|| BytesCache::new(CERT_STORE_CACHE_CAPACITY));
+
+/// The encoding of the certificate bytes a store was built from.
+#[derive(Clone, Copy, PartialEq, Eq, Hash)]
+enum Encoding {
+    Der,
+    PemCerts,
+    Pem,
+}
+
+/// PEM input accepted by [`CertStore::from_pem_certs`].
+#[derive(FromPyObject)]
+pub enum PemCerts {
+    Stack(PyBackedBytes),
+    Certs(Vec<PyBackedStr>),
+}
+
 #[derive(Clone)]
 #[pyclass(from_py_object)]
 pub struct CertStore(pub wreq::tls::trust::CertStore);
@@ -48,29 +76,78 @@ impl CertStore {
     #[staticmethod]
     #[pyo3(signature = (certs))]
     pub fn from_der_certs(certs: Vec<PyBackedBytes>) -> PyResult<CertStore> {
-        wreq::tls::trust::CertStore::from_der_certs(&certs)
-            .map(CertStore)
-            .map_err(Error::Library)
-            .map_err(Into::into)
+        CertStore::cached(Encoding::Der, &certs, || {
+            wreq::tls::trust::CertStore::from_der_certs(&certs)
+        })
+        .map(CertStore)
+        .map_err(Error::Library)
+        .map_err(Into::into)
     }
 
     /// Creates a new `CertStore` from a collection of PEM-encoded certificates.
+    ///
+    /// Each list entry must be a single PEM certificate and is validated on its own. A `bytes`
+    /// bundle is parsed as a PEM stack, as with [`CertStore::from_pem_stack`].
     #[staticmethod]
     #[pyo3(signature = (certs))]
-    pub fn from_pem_certs(certs: Vec<PyBackedStr>) -> PyResult<CertStore> {
-        wreq::tls::trust::CertStore::from_pem_certs(&certs)
+    pub fn from_pem_certs(certs: PemCerts) -> PyResult<CertStore> {
+        match certs {
+            PemCerts::Stack(stack) => Self::from_pem_stack(stack),
+            PemCerts::Certs(certs) => CertStore::cached(Encoding::PemCerts, &certs, || {
+                wreq::tls::trust::CertStore::from_pem_certs(&certs)
+            })
             .map(CertStore)
             .map_err(Error::Library)
-            .map_err(Into::into)
+            .map_err(Into::into),
+        }
     }
 
     /// Creates a new `CertStore` from a PEM-encoded certificate stack.
+    ///
+    /// This is the preferred way to load a CA bundle such as `ca-certificates.crt`.
     #[staticmethod]
     #[pyo3(signature = (certs))]
     pub fn from_pem_stack(certs: PyBackedBytes) -> PyResult<CertStore> {
-        wreq::tls::trust::CertStore::from_pem_stack(certs.as_ref())
+        CertStore::load_pem_stack(&certs)
             .map(CertStore)
             .map_err(Error::Library)
             .map_err(Into::into)
     }
+
+    /// Drops every store cached by the `from_*` constructors, releasing the certificates they
+    /// were built from. Stores already handed out stay valid.
+    #[staticmethod]
+    pub fn clear_cache() {
+        CERT_STORES.clear();
+    }
+}
+
+impl CertStore {
+    /// Builds a store from a PEM-encoded certificate stack, sharing the store with any
+    /// earlier load of the same bytes.
+    pub fn load_pem_stack(stack: &[u8]) -> Result<wreq::tls::trust::CertStore, wreq::Error> {
+        CertStore::cached(Encoding::Pem, &[stack], || {
+            wreq::tls::trust::CertStore::from_pem_stack(stack)
+        })
+    }
+
+    /// Returns the cached store for `certs`, building it with `build` on a miss.
+    ///
+    /// The certificates are only borrowed for the lookup; they are copied into the cache once,
+    /// when a newly built store is inserted.
+    fn cached<B, F>(
+        encoding: Encoding,
+        certs: &[B],
+        build: F,
+    ) -> Result<wreq::tls::trust::CertStore, wreq::Error>
+    where
+        B: AsRef<[u8]>,
+        F: FnOnce() -> Result<wreq::tls::trust::CertStore, wreq::Error>,
+    {
+        if let Some(store) = CERT_STORES.get(encoding, certs) {
+            return Ok(store);
+        }
+
+        build().map(|store| CERT_STORES.insert(encoding, certs, store))
+    }
 }
@@ -5,10 +5,20 @@ from wreq.cookie import Cookie
 client = wreq.Client()
 
 
+@pytest.fixture(scope="module")
+def _module_jar():
+    return wreq.Jar()
+
+
+@pytest.fixture
+def jar(_module_jar):
+    """A cookie jar shared by the tests in this module and emptied after each test."""
+    yield _module_jar
+    _module_jar.clear()
+
+
 @pytest.mark.asyncio
-@pytest.mark.flaky(reruns=3, reruns_delay=2)
-async def test_get_cookie():
-    jar = wreq.Jar()
+async def test_get_cookie(jar):
     url = "http://localhost:8080/cookies"
     cookie = Cookie("test_cookie", "12345", domain="localhost", path="/cookies")
     jar.add(cookie, url)
@@ -36,9 +46,7 @@ async def test_get_cookie():
 
 
 @pytest.mark.asyncio
-@pytest.mark.flaky(reruns=3, reruns_delay=2)
-async def test_get_all_cookies():
-    jar = wreq.Jar()
+async def test_get_all_cookies(jar):
     url = "http://localhost:8080/cookies"
     cookie1 = Cookie("test_cookie1", "12345", domain="localhost", path="/cookies")
     cookie2 = Cookie("test_cookie2", "67890", domain="localhost", path="/cookies")
@@ -60,9 +68,7 @@ async def test_get_all_cookies():
 
 
 @pytest.mark.asyncio
-@pytest.mark.flaky(reruns=3, reruns_delay=2)
-async def test_remove_cookie():
-    jar = wreq.Jar()
+async def test_remove_cookie(jar):
     client = wreq.Client(cookie_provider=jar)
     url = "http://localhost:8080/cookies"
     cookie = Cookie("test_cookie", "12345", domain="localhost", path="/cookies")
@@ -86,9 +92,7 @@ async def test_remove_cookie():
 
 
 @pytest.mark.asyncio
-@pytest.mark.flaky(reruns=3, reruns_delay=2)
-async def test_clear_cookies():
-    jar = wreq.Jar()
+async def test_clear_cookies(jar):
     client = wreq.Client(cookie_provider=jar)
     url = "http://localhost:8080/cookies"
     cookie1 = Cookie("test_cookie1", "12345", domain="localhost", path="/cookies")
@@ -120,11 +124,10 @@ async def test_clear_cookies():
 
 
 @pytest.mark.asyncio
-async def test_client_cookie_jar_accessor():
+async def test_client_cookie_jar_accessor(jar):
     url = "http://localhost:8080/cookies"
 
     # 1) If a cookie_provider is passed, client.cookie_jar should return it (shared storage).
-    jar = wreq.Jar()
     client = wreq.Client(cookie_provider=jar)
     assert client.cookie_jar is not None
     client.cookie_jar.add("test_cookie=12345; Path=/cookies; Domain=localhost", url)
@@ -151,10 +154,8 @@ async def test_client_cookie_jar_accessor():
 
 
 @pytest.mark.asyncio
-@pytest.mark.flaky(reruns=3, reruns_delay=2)
-async def test_cookie_storage_from_server():
+async def test_cookie_storage_from_server(jar):
     """Test that cookies set by the server are actually stored in the jar."""
-    jar = wreq.Jar()
     client = wreq.Client(cookie_provider=jar)
 
     # Request httpbin to set a cookie (returns 302 redirect, which is expected)
@@ -193,10 +194,8 @@ async def test_cookie_storage_from_server():
 
 
 @pytest.mark.asyncio
-@pytest.mark.flaky(reruns=3, reruns_delay=2)
-async def test_cookie_value_update_from_server():
+async def test_cookie_value_update_from_server(jar):
     """Test that cookie values can be updated by server responses."""
-    jar = wreq.Jar()
     client = wreq.Client(cookie_provider=jar)
     url = "http://localhost:8080"
 
@@ -15,7 +15,8 @@ async def test_proxy_connection_error():
         "socks5h://invalid.proxy:8080",
     ]
     target_urls = ["https://example.com", "http://example.com"]
-    for proxy in invalid_proxies:
+    for proxy_url in invalid_proxies:
+        proxy = wreq.Proxy.all(proxy_url)
         for url in target_urls:
             with pytest.raises(exceptions.ProxyConnectionError):
-                await wreq.get(url, proxy=wreq.Proxy.all(proxy))
+                await wreq.get(url, proxy=proxy)
@@ -161,3 +161,17 @@ def test_init_with_dict():
     assert not h.is_empty()
     assert h.contains_key("A")
     assert h.contains_key("B")
+
+
+@pytest.mark.flaky(reruns=3, reruns_delay=2)
+def test_case_insensitive_lookup():
+    h = HeaderMap({"Content-Type": "application/json"})
+    h.append("ACCEPT", "text/html")
+    h.append("accept", "application/json")
+    assert h["content-type"] == b"application/json"
+    assert h.get("CONTENT-TYPE") == b"application/json"
+    assert "cOnTeNt-TyPe" in h
+    assert list(h.get_all("Accept")) == [b"text/html", b"application/json"]
+    h.remove("Content-type")
+    assert "content-type" not in h
+    assert h.keys_len() == 1
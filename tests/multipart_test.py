@@ -16,6 +16,7 @@ def assert_form_value(data, key, expected):
 
 
 @pytest.mark.asyncio
+@pytest.mark.network
 @pytest.mark.flaky(reruns=3, reruns_delay=2)
 async def test_reuse_multipart_with_clonable_parts():
     form = Multipart(
@@ -37,6 +38,7 @@ async def test_reuse_multipart_with_clonable_parts():
 
 
 @pytest.mark.asyncio
+@pytest.mark.network
 @pytest.mark.flaky(reruns=3, reruns_delay=2)
 async def test_stream_part_is_one_shot_when_reusing_multipart():
     def file_stream(path):
@@ -64,6 +66,7 @@ async def test_stream_part_is_one_shot_when_reusing_multipart():
 
 
 @pytest.mark.asyncio
+@pytest.mark.network
 @pytest.mark.flaky(reruns=3, reruns_delay=2)
 async def test_reuse_same_part_without_copy_for_clonable_value():
     part = Part(name="a", value="1")
@@ -6,6 +6,7 @@ client = wreq.Client(redirect=redirect.Policy.limited(10))
 
 
 @pytest.mark.asyncio
+@pytest.mark.network
 @pytest.mark.flaky(reruns=3, reruns_delay=2)
 async def test_request_disable_redirect():
     response = await client.get(
@@ -17,6 +18,7 @@ async def test_request_disable_redirect():
 
 
 @pytest.mark.asyncio
+@pytest.mark.network
 @pytest.mark.flaky(reruns=3, reruns_delay=2)
 async def test_request_enable_redirect():
     response = await client.get(
@@ -28,6 +30,7 @@ async def test_request_enable_redirect():
 
 
 @pytest.mark.asyncio
+@pytest.mark.network
 @pytest.mark.flaky(reruns=3, reruns_delay=2)
 async def test_client_request_disable_redirect():
     client = wreq.Client(redirect=redirect.Policy.none())
@@ -37,6 +40,7 @@ async def test_client_request_disable_redirect():
 
 
 @pytest.mark.asyncio
+@pytest.mark.network
 @pytest.mark.flaky(reruns=3, reruns_delay=2)
 async def test_client_request_enable_redirect():
     response = await client.get("https://google.com")
@@ -45,6 +49,7 @@ async def test_client_request_enable_redirect():
 
 
 @pytest.mark.asyncio
+@pytest.mark.network
 @pytest.mark.flaky(reruns=3, reruns_delay=2)
 async def test_client_redirec_history():
     url = "https://google.com/"
@@ -1,5 +1,6 @@
 import pytest
 import wreq
+import wreq.blocking
 from wreq import Version
 from wreq.header import HeaderMap
 
@@ -79,6 +80,7 @@ async def test_basic_auth():
 
 
 @pytest.mark.asyncio
+@pytest.mark.network
 @pytest.mark.flaky(reruns=3, reruns_delay=2)
 async def test_send_with_version():
     url = "https://www.google.com/anything"
@@ -205,3 +207,25 @@ async def test_send_sync_bytes_stream():
     async with resp:
         json = await resp.json()
         assert json["data"] in open("README.md").read()
+
+
+@pytest.mark.asyncio
+async def test_module_requests_share_no_state():
+    resp = await wreq.get(
+        "http://localhost:8080/cookies/set?shared=1",
+        headers={"X-Once": "1"},
+    )
+    async with resp:
+        assert resp.status.is_success() or resp.status.is_redirection()
+
+    resp = await wreq.get("http://localhost:8080/anything")
+    async with resp:
+        json = await resp.json()
+        assert "Cookie" not in json["headers"]
+        assert "X-Once" not in json["headers"]
+
+    with wreq.blocking.get("http://localhost:8080/anything") as resp:
+        assert resp.status.is_success()
+        json = resp.json()
+        assert "Cookie" not in json["headers"]
+        assert "X-Once" not in json["headers"]
@@ -112,6 +112,7 @@ async def test_get_stream():
 
 
 @pytest.mark.asyncio
+@pytest.mark.network
 @pytest.mark.flaky(reruns=3, reruns_delay=2)
 async def test_peer_certificate():
     resp = await client.get("https://www.google.com/anything")
@@ -1,22 +1,26 @@
+import ssl
+from pathlib import Path
+
 import pytest
 import wreq
 from wreq.emulation import Emulation
-from wreq.tls import CertStore
+import wreq.exceptions as exceptions
+from wreq.tls import CertStore, Identity, TlsOptions, TlsVersion
+
+CERTS = Path(__file__).parent / "certs"
 
 
 @pytest.mark.asyncio
-@pytest.mark.flaky(reruns=3, reruns_delay=2)
-async def test_badssl():
+async def test_badssl(local_tls_server):
     client = wreq.Client(tls_verify=False)
-    resp = await client.get("https://self-signed.badssl.com/")
+    resp = await client.get(local_tls_server)
     async with resp:
         assert resp.status.is_success()
 
 
 @pytest.mark.asyncio
-@pytest.mark.flaky(reruns=3, reruns_delay=2)
-async def test_badssl_invalid_cert():
-    url = "https://self-signed.badssl.com/"
+async def test_badssl_invalid_cert(local_tls_server):
+    url = local_tls_server
     client = wreq.Client(tls_verify=False, tls_info=True)
     resp = await client.get(url)
     async with resp:
@@ -40,6 +44,7 @@ async def test_badssl_invalid_cert():
 
 
 @pytest.mark.asyncio
+@pytest.mark.network
 @pytest.mark.flaky(reruns=3, reruns_delay=2)
 async def test_alps_new_endpoint():
     url = "https://google.com"
@@ -48,3 +53,111 @@ async def test_alps_new_endpoint():
     async with resp:
         text = await resp.text()
         assert text is not None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "ciphers, ok",
+    [
+        (["ECDHE-ECDSA-AES128-GCM-SHA256", "ECDHE-ECDSA-CHACHA20-POLY1305"], True),
+        (["ECDHE-RSA-AES128-GCM-SHA256"], False),
+    ],
+)
+async def test_cipher_list_sequence_matches_string(local_tls_server, ciphers, ok):
+    for cipher_list in (ciphers, ":".join(ciphers)):
+        options = TlsOptions(
+            cipher_list=cipher_list, max_tls_version=TlsVersion.TLS_1_2
+        )
+        client = wreq.Client(tls_verify=False, tls_options=options)
+        if ok:
+            resp = await client.get(local_tls_server)
+            async with resp:
+                assert resp.status.is_success()
+        else:
+            with pytest.raises((exceptions.TlsError, exceptions.ConnectionError)):
+                await client.get(local_tls_server)
+
+
+@pytest.mark.parametrize("option", ["cipher_list", "curves_list", "sigalgs_list"])
+@pytest.mark.parametrize("value", [[], ""])
+def test_colon_list_rejects_empty(option, value):
+    with pytest.raises(ValueError, match=option):
+        TlsOptions(**{option: value})
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "load",
+    [
+        lambda pem: CertStore.from_pem_certs([pem.decode()]),
+        lambda pem: CertStore.from_pem_certs(pem),
+        lambda pem: CertStore.from_pem_certs(bytearray(pem)),
+        lambda pem: CertStore.from_pem_stack(pem),
+    ],
+    ids=["list", "bytes", "bytearray", "stack"],
+)
+async def test_cert_store_from_pem(local_tls_server, load):
+    store = load((CERTS / "localhost.pem").read_bytes())
+    client = wreq.Client(tls_verify=store)
+    resp = await client.get(local_tls_server)
+    async with resp:
+        assert resp.status.is_success()
+
+
+def test_cert_store_from_pem_certs_rejects_invalid_entry():
+    pem = (CERTS / "localhost.pem").read_text()
+    with pytest.raises((exceptions.TlsError, exceptions.BuilderError)):
+        CertStore.from_pem_certs([pem, "not a certificate"])
+
+
+@pytest.mark.asyncio
+async def test_identity_pkcs12_cache(local_tls_server):
+    archive = (CERTS / "identity.p12").read_bytes()
+    Identity.clear_cache()
+
+    Identity.from_pkcs12_der(archive, "secret")
+    cached = Identity.from_pkcs12_der(archive, "secret")
+    client = wreq.Client(tls_verify=False, tls_identity=cached)
+    resp = await client.get(local_tls_server)
+    async with resp:
+        assert resp.status.is_success()
+
+    # A cached archive must not be returned for a different password.
+    with pytest.raises((exceptions.TlsError, exceptions.BuilderError)):
+        Identity.from_pkcs12_der(archive, "wrong")
+
+    Identity.clear_cache()
+
+
+@pytest.mark.asyncio
+async def test_cert_store_cache(local_tls_server):
+    pem = (CERTS / "localhost.pem").read_bytes()
+    der = ssl.PEM_cert_to_DER_cert(pem.decode())
+    CertStore.clear_cache()
+    for verify in (
+        CertStore.from_pem_stack(pem),
+        CertStore.from_pem_stack(pem),
+        CERTS / "localhost.pem",
+        CertStore.from_der_certs([der]),
+        CertStore.from_der_certs([der]),
+        CertStore.from_pem_certs([pem.decode()]),
+        CertStore.from_pem_certs([pem.decode()]),
+    ):
+        client = wreq.Client(tls_verify=verify)
+        resp = await client.get(local_tls_server)
+        async with resp:
+            assert resp.status.is_success()
+
+    # A different bundle must get its own store, not the cached one.
+    other = CertStore.from_pem_stack((CERTS / "other.pem").read_bytes())
+    client = wreq.Client(tls_verify=other)
+    with pytest.raises((exceptions.TlsError, exceptions.ConnectionError)):
+        await client.get(local_tls_server)
+
+    # Clearing the cache keeps stores already handed out usable.
+    store = CertStore.from_pem_stack(pem)
+    CertStore.clear_cache()
+    client = wreq.Client(tls_verify=store)
+    resp = await client.get(local_tls_server)
+    async with resp:
+        assert resp.status.is_success()